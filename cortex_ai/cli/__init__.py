@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from ..core import scanner, classifier, planner, executor
+# The core pipeline modules (scanner, classifier, planner, executor) pull in
+# pandas, numpy and the OpenAI client; they are imported inside the commands
+# that need them so `--help` and `version` start without that cost.
 from ..core.errors import (
     PathNotFoundError,
     PathNotDirectoryError,
@@ -49,7 +51,6 @@ from ..utils.console import (
 )
 
 import typer
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
 app = typer.Typer(no_args_is_help=True, help="Cortex AI – AI-assisted folder organizer.")
 
@@ -81,6 +82,10 @@ def scan(
       - build a plan
       - print summary (categories, counts, sizes, samples, confidence)
     """
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    from ..core import scanner, classifier, planner
+
     # 1) Resolve root path (expand ~, check exist/dir)
     try:
         root: Path = resolve_root(path)
@@ -160,9 +165,14 @@ def organize(
       - classify (rules + LLM)
       - build a plan + print summary
       - prompt user
-      - apply moves + write CSV move log
+      - apply moves + write move log
     """
-    # 1) Resolve root path
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    from ..core import scanner, classifier, planner, executor
+
+    # 1) Resolve root path (once; scanner, executor and logger all reuse this
+    #    absolute, resolved Path)
     try:
         root: Path = resolve_root(path)
     except PathNotFoundError:
@@ -227,7 +237,7 @@ def organize(
         print_no_changes_applied()
         raise typer.Exit(code=0)
 
-    # 6) Apply plan (moves + CSV log)
+    # 6) Apply plan (moves + move log)
     print_applying_plan()
 
     try:
@@ -242,24 +252,24 @@ def organize(
         raise typer.Exit(code=1)
 
     # 7) Print per-file warnings for failures
-    if not moves_df.empty and "status" in moves_df.columns:
-        for _, r in moves_df.iterrows():
-            status = str(r.get("status", ""))
-            if status.startswith("failed:"):
-                reason = status[len("failed:") :].strip() or status
-                print_move_warning(str(r.get("old_path", "")), reason)
+    # Status masks are computed once and reused for the warnings and the
+    # end-of-run counts below.
+    status = moves_df["status"].astype(str)
+    success_mask = status == "success"
+    failed_mask = status.str.startswith("failed:")
+
+    if failed_mask.any():
+        failed = moves_df.loc[failed_mask, ["old_path", "status"]]
+        for old_path, failed_status in zip(
+            failed["old_path"].astype(str).to_numpy(), failed["status"].astype(str).to_numpy()
+        ):
+            reason = failed_status[len("failed:") :].strip() or failed_status
+            print_move_warning(old_path, reason)
 
     # 8) End-of-run summaries
-    if moves_df.empty:
-        moved_success = 0
-        failed_count = 0
-        category_count = 0
-    else:
-        moved_success = int((moves_df["status"] == "success").sum())
-        failed_count = int(moves_df["status"].astype(str).str.startswith("failed").sum())
-        category_count = int(
-            moves_df.loc[moves_df["status"] == "success", "category"].nunique()
-        )
+    moved_success = int(success_mask.sum())
+    failed_count = int(failed_mask.sum())
+    category_count = int(moves_df.loc[success_mask, "category"].nunique()) if moved_success else 0
 
     print_organize_move_overview(
         moved_count=moved_success,
@@ -272,11 +282,10 @@ def organize(
     )
 
     # Special note for uncertain_review behavior (if any)
-    if not moves_df.empty and "category" in moves_df.columns:
+    if moved_success:
         uncertain_samples = (
             moves_df.loc[
-                (moves_df["category"] == "uncertain_review")
-                & (moves_df["status"] == "success"),
+                success_mask & (moves_df["category"] == "uncertain_review"),
                 "file_name",
             ]
             .astype(str)
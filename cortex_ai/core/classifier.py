@@ -24,10 +24,14 @@ The CLI layer (Typer commands) will catch these errors and use console helpers
 to print friendly user-facing messages.
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Tuple
 
 import json
+import numpy as np
 import pandas as pd
 from openai import OpenAI
 
@@ -37,7 +41,7 @@ from .errors import (
     LlmResponseParseError,
     ClassificationError
 )
-from .models import LlmClassificationResult
+from .models import LlmClassificationResult, STRING_DTYPE
 from ..utils.env import get_llm_api_key
 
 # ---------------------------------------------------------------------------
@@ -89,6 +93,8 @@ DEFAULT_EXTENSION_MAP: Dict[str, str] = {
     ".zip": "archives_installers",
     ".tar": "archives_installers",
     ".tar.gz": "archives_installers",
+    ".tar.bz2": "archives_installers",
+    ".tar.xz": "archives_installers",
     ".tgz": "archives_installers",
     ".rar": "archives_installers",
     ".dmg": "archives_installers",
@@ -101,6 +107,82 @@ DEFAULT_EXTENSION_MAP: Dict[str, str] = {
     ".DS_Store".lower(): "trash_or_temp",
 }
 
+# Read-only lookup compiled once at import time (keys normalized to lowercase).
+_EXTENSION_LOOKUP: Mapping[str, str] = MappingProxyType(
+    {ext.lower(): category for ext, category in DEFAULT_EXTENSION_MAP.items()}
+)
+
+# Multi-part extensions such as ".tar.gz", longest first. An extension column
+# built with Path.suffix only holds the last part (".gz"), so these are also
+# matched against the file name.
+_MULTIPART_EXTENSIONS: Tuple[str, ...] = tuple(
+    sorted((ext for ext in _EXTENSION_LOOKUP if ext.count(".") > 1), key=len, reverse=True)
+)
+
+# ---------------------------------------------------------------------------
+# LLM request batching
+# ---------------------------------------------------------------------------
+
+# Number of files sent to the LLM per request.
+LLM_BATCH_SIZE = 50
+
+# Maximum number of LLM requests in flight at once.
+LLM_MAX_WORKERS = 8
+
+# Retries (with exponential backoff) for rate-limited or failed LLM requests.
+LLM_MAX_RETRIES = 3
+
+# Shared client, created lazily by _get_client().
+_CLIENT: Optional[OpenAI] = None
+
+# Categories list as prompt text, e.g. '"school_work", "code_projects", ...'.
+_CATEGORIES_STR = ", ".join(f'"{c}"' for c in CATEGORIES)
+
+# Fixed instructions sent at the start of every classification request,
+# followed by the batch's file metadata as JSON.
+_PROMPT_PREFIX = (
+    "You are helping to organize a user's filesystem.\n"
+    "For each file below, assign the most appropriate category from this list:\n"
+    f"[{_CATEGORIES_STR}]\n\n"
+    "Return one entry in 'results' per file, with its full_path, category and "
+    "confidence (a number between 0 and 1).\n\n"
+    "Here is the list of files (as JSON):\n"
+)
+
+# Structured-output format for classification responses. The model is
+# constrained to this schema, so responses always parse and categories are
+# always drawn from CATEGORIES.
+LLM_RESPONSE_SCHEMA: Dict[str, Any] = {
+    "type": "json_schema",
+    "name": "file_classifications",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "results": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "full_path": {"type": "string"},
+                        "category": {"type": "string", "enum": CATEGORIES},
+                        "confidence": {"type": "number", "minimum": 0, "maximum": 1},
+                    },
+                    "required": ["full_path", "category", "confidence"],
+                    "additionalProperties": False,
+                },
+            },
+        },
+        "required": ["results"],
+        "additionalProperties": False,
+    },
+}
+
+# Columns classify_files() requires on its input DataFrame.
+_CLASSIFY_REQUIRED = frozenset(
+    {"file_name", "extension", "full_path", "size_bytes", "modified_time"}
+)
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -123,18 +205,23 @@ def classify_files(df: pd.DataFrame, min_confidence: float = 0.65) -> pd.DataFra
            category = DEFAULT_EXTENSION_MAP[extension]
            classifier_type = "rule"
            confidence = 1.0
+       - Rows whose extension doesn't match are also checked by file name,
+         for multi-part extensions (".tar.gz") and dotfiles (".ds_store").
 
     4. For rows still missing a category:
        - Build a simple list of dicts with metadata:
          {file_name, extension, full_path, size_bytes, modified_time}
        - Call _llm_classify_files(...) to obtain category + confidence.
-       - Fill "category", "classifier_type" = "llm", "confidence".
+       - Fill "category", "classifier_type" = "llm", "confidence", with
+         confidence clamped to [0, 1] and unknown categories mapped to
+         "uncertain_review".
 
-    5. Apply min_confidence threshold:
-       - For rows with classifier_type == "llm" and confidence < min_confidence:
+    5. Apply min_confidence threshold (only when step 4 called the LLM):
+       - For rows classified by the LLM with confidence < min_confidence:
            category = "uncertain_review"
 
-    Returns a NEW DataFrame (copy) with the classification columns added.
+    Returns a NEW DataFrame with the classification columns added; the input
+    DataFrame is never modified.
 
     May raise:
     - MissingApiKeyError: if OPENAI_API_KEY is not set (via get_llm_api_key()).
@@ -142,97 +229,158 @@ def classify_files(df: pd.DataFrame, min_confidence: float = 0.65) -> pd.DataFra
     - LlmResponseParseError: if the LLM response is malformed or not JSON.
     - ClassificationError: for unexpected internal issues (e.g. bad df schema).
     """
-    required_columns = {"file_name", "extension", "full_path", "size_bytes", "modified_time"}
-    missing = required_columns.difference(df.columns)
-    if missing:
+    if not _CLASSIFY_REQUIRED.issubset(df.columns):
+        missing = _CLASSIFY_REQUIRED.difference(df.columns)
         raise ClassificationError(
             f"DataFrame is missing required columns for classification: {sorted(missing)}"
         )
 
-    # Work on a copy to avoid surprising external callers.
-    df = df.copy()
+    n = len(df)
 
     # Normalize extension strings to lowercase.
-    df["extension"] = df["extension"].astype(str).str.lower()
-
-    # Initialize classification columns if they don't exist yet.
-    if "category" not in df.columns:
-        df["category"] = None
-    if "classifier_type" not in df.columns:
-        df["classifier_type"] = None
-    if "confidence" not in df.columns:
-        df["confidence"] = None
+    extension = df["extension"].astype(STRING_DTYPE).str.lower()
+
+    # Classification columns are built as standalone typed arrays (starting from
+    # any existing values) and attached with a single assign() at the end, so
+    # the input frame is never copied wholesale. Typed arrays (nullable strings,
+    # float64 with NaN) avoid boxing every value as an object.
+    category = (
+        pd.array(df["category"], dtype=STRING_DTYPE, copy=True)
+        if "category" in df.columns
+        else pd.array([pd.NA] * n, dtype=STRING_DTYPE)
+    )
+    classifier_type = (
+        pd.array(df["classifier_type"], dtype=STRING_DTYPE, copy=True)
+        if "classifier_type" in df.columns
+        else pd.array([pd.NA] * n, dtype=STRING_DTYPE)
+    )
+    confidence = (
+        pd.to_numeric(df["confidence"], errors="coerce").to_numpy(dtype="float64", copy=True)
+        if "confidence" in df.columns
+        else np.full(n, np.nan, dtype="float64")
+    )
 
     # ------------------------------------------------------------------
     # 1. Rule-based classification
     # ------------------------------------------------------------------
-    for ext, category in DEFAULT_EXTENSION_MAP.items():
-        mask = df["extension"] == ext
-        if not mask.any():
-            continue
-        df.loc[mask, "category"] = category
-        df.loc[mask, "classifier_type"] = "rule"
-        df.loc[mask, "confidence"] = 1.0
+    # A single hashed lookup per row instead of one full-column scan per extension.
+    rule_categories = extension.map(_EXTENSION_LOOKUP).to_numpy(dtype=object)
+    matched = pd.notna(rule_categories)
+
+    # Rows whose extension didn't match may still match by file name
+    # (multi-part suffixes, dotfiles); resolving them here saves LLM calls.
+    unmatched = np.flatnonzero(~matched)
+    if len(unmatched):
+        names = df["file_name"].to_numpy()[unmatched]
+        by_name = [_category_for_name(str(name).lower()) for name in names]
+        rule_categories[unmatched] = by_name
+        matched[unmatched] = [cat is not None for cat in by_name]
+
+    category[matched] = rule_categories[matched]
+    classifier_type[matched] = "rule"
+    confidence[matched] = 1.0
 
     # ------------------------------------------------------------------
     # 2. LLM classification for ambiguous rows
     # ------------------------------------------------------------------
-    ambiguous_mask = df["category"].isna()
-    ambiguous_df = df[ambiguous_mask]
-
-    if not ambiguous_df.empty:
-        # Build simple metadata objects for the LLM.
-        rows_for_llm: List[Dict[str, Any]] = []
-        for _, row in ambiguous_df.iterrows():
-            rows_for_llm.append(
+    ambiguous = np.asarray(pd.isna(category))
+
+    if ambiguous.any():
+        # Build simple metadata objects for the LLM (column-wise, no per-row Series).
+        rows_for_llm: List[Dict[str, Any]] = (
+            df.loc[ambiguous, ["file_name", "extension", "full_path", "size_bytes", "modified_time"]]
+            .assign(extension=extension[ambiguous])
+            .astype(
                 {
-                    "file_name": str(row["file_name"]),
-                    "extension": str(row["extension"]),
-                    "full_path": str(row["full_path"]),
-                    "size_bytes": int(row["size_bytes"]),
-                    "modified_time": float(row["modified_time"]),
+                    "file_name": str,
+                    "extension": str,
+                    "full_path": str,
+                    "size_bytes": "int64",
+                    "modified_time": "float64",
                 }
             )
+            .to_dict(orient="records")
+        )
 
         # Ask the LLM to classify these files.
         llm_results = _llm_classify_files(rows_for_llm)
 
-        # Merge results back into df.
-        for idx, row in ambiguous_df.iterrows():
-            full_path = str(row["full_path"])
-            res = llm_results.get(full_path)
-
-            if res is None:
-                # If the model failed to return a result for this file,
-                # treat it as uncertain.
-                df.at[idx, "category"] = "uncertain_review"
-                df.at[idx, "classifier_type"] = "llm"
-                df.at[idx, "confidence"] = 0.0
-                continue
-
-            category = res.category
-            confidence = res.confidence
+        # Merge results back: look up each row's result, then clamp and
+        # normalize the whole batch with array ops and write all three columns
+        # with one vectorized assignment each.
+        resolved = [llm_results.get(row["full_path"]) for row in rows_for_llm]
 
-            # If LLM proposes an unknown category, default to uncertain_review.
-            if category not in CATEGORIES:
-                category = "uncertain_review"
+        # If the model failed to return a result for a file, treat it as
+        # uncertain with zero confidence.
+        categories_out = np.array(
+            [res.category if res is not None else "uncertain_review" for res in resolved],
+            dtype=object,
+        )
+        confidences_out = np.array(
+            [res.confidence if res is not None else 0.0 for res in resolved],
+            dtype="float64",
+        )
 
-            df.at[idx, "category"] = category
-            df.at[idx, "classifier_type"] = "llm"
-            df.at[idx, "confidence"] = confidence
+        # Confidence must lie in [0, 1]; unknown categories become uncertain_review.
+        np.clip(confidences_out, 0.0, 1.0, out=confidences_out)
+        categories_out[~np.isin(categories_out, CATEGORIES)] = "uncertain_review"
+
+        # ------------------------------------------------------------------
+        # 3. Apply min_confidence threshold for LLM classifications
+        # ------------------------------------------------------------------
+        # Only rows classified by the LLM above can fall below the threshold,
+        # so it is applied to this batch's float64 array directly; when no
+        # LLM call was needed, the step is skipped entirely.
+        categories_out[confidences_out < float(min_confidence)] = "uncertain_review"
+
+        category[ambiguous] = categories_out
+        classifier_type[ambiguous] = "llm"
+        confidence[ambiguous] = confidences_out
+
+    return df.assign(
+        extension=extension,
+        category=category,
+        classifier_type=classifier_type,
+        confidence=confidence,
+    )
 
-    # ------------------------------------------------------------------
-    # 3. Apply min_confidence threshold for LLM classifications
-    # ------------------------------------------------------------------
-    llm_mask = df["classifier_type"] == "llm"
-    low_conf_mask = llm_mask & (df["confidence"].astype(float) < float(min_confidence))
-    df.loc[low_conf_mask, "category"] = "uncertain_review"
+# ---------------------------------------------------------------------------
+# Internal: rule lookup by file name
+# ---------------------------------------------------------------------------
+@lru_cache(maxsize=4096)
+def _category_for_name(name_lower: str) -> Optional[str]:
+    """
+    Return the rule-based category for a lowercase file name, or None.
 
-    return df
+    Used for rows whose extension didn't match DEFAULT_EXTENSION_MAP: checks
+    multi-part extensions (".tar.gz") first, then the whole name for dotfiles
+    listed in the map (".ds_store").
+    """
+    for ext in _MULTIPART_EXTENSIONS:
+        if name_lower.endswith(ext):
+            return _EXTENSION_LOOKUP[ext]
+    return _EXTENSION_LOOKUP.get(name_lower)
 
 # ---------------------------------------------------------------------------
 # Internal: LLM integration
 # ---------------------------------------------------------------------------
+def _get_client() -> OpenAI:
+    """
+    Return the shared OpenAI client, creating it on first use.
+
+    Every batch and every classify_files() call reuses this client, and with
+    it one warm HTTP connection pool. Transient failures (429s, 5xx,
+    connection errors) are retried by the client with exponential backoff,
+    up to LLM_MAX_RETRIES times, before surfacing as LlmUnavailableError.
+
+    Raises MissingApiKeyError (via get_llm_api_key()) if the key is not set.
+    """
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = OpenAI(api_key=get_llm_api_key(), max_retries=LLM_MAX_RETRIES)
+    return _CLIENT
+
+
 def _llm_classify_files(rows: List[Dict[str, Any]]) -> Dict[str, LlmClassificationResult]:
     """
         Call the LLM to classify a list of files.
@@ -248,17 +396,10 @@ def _llm_classify_files(rows: List[Dict[str, Any]]) -> Dict[str, LlmClassificati
         Behavior:
 
         - Uses OPENAI_API_KEY (enforced by get_llm_api_key()).
-        - Builds a single prompt instructing the model to return a JSON object:
-            {
-              "<full_path>": {
-                "category": "<one_of_categories>",
-                "confidence": <float_between_0_and_1>
-              },
-              ...
-            }
-          where category is one of CATEGORIES.
-
-        - Parses the response as JSON.
+        - Splits rows into batches of LLM_BATCH_SIZE files and classifies the
+          batches concurrently (up to LLM_MAX_WORKERS requests in flight), so a
+          large scan never turns into a single oversized prompt.
+        - Each batch is handled by _llm_classify_batch(...).
         - Returns a mapping: full_path -> LlmClassificationResult.
 
         Raises:
@@ -270,89 +411,93 @@ def _llm_classify_files(rows: List[Dict[str, Any]]) -> Dict[str, LlmClassificati
         return {}
 
     # Ensure the API key is present; get_llm_api_key will raise MissingApiKeyError if not.
-    api_key = get_llm_api_key()
-    client = OpenAI(api_key=api_key)
-
-    # Prepare categories list as text.
-    categories_str = ", ".join(f'"{c}"' for c in CATEGORIES)
-
-    # Construct the user input: a JSON list of file metadata.
-    files_json = json.dumps(rows, indent=2)
-
-    prompt = (
-        "You are helping to organize a user's filesystem.\n"
-        "For each file below, assign the most appropriate category from this list:\n"
-        f"[{categories_str}]\n\n"
-        "Return a single JSON object mapping each file's full_path to an object "
-        "with fields 'category' and 'confidence' (a number between 0 and 1).\n\n"
-        "Example format:\n"
-        "{\n"
-        '  "/absolute/path/to/file1.pdf": {"category": "documents_misc", "confidence": 0.92},\n'
-        '  "/absolute/path/to/photo.jpg": {"category": "photos_images", "confidence": 0.88}\n'
-        "}\n\n"
-        "Here is the list of files (as JSON):\n"
-        f"{files_json}\n"
-    )
+    client = _get_client()
+
+    batches = [rows[i : i + LLM_BATCH_SIZE] for i in range(0, len(rows), LLM_BATCH_SIZE)]
+    if len(batches) == 1:
+        return _llm_classify_batch(client, batches[0])
+
+    results: Dict[str, LlmClassificationResult] = {}
+
+    with ThreadPoolExecutor(max_workers=min(LLM_MAX_WORKERS, len(batches))) as pool:
+        futures = [pool.submit(_llm_classify_batch, client, batch) for batch in batches]
+        try:
+            for future in as_completed(futures):
+                results.update(future.result())
+        except Exception:
+            # One failed batch aborts the whole classification; don't start
+            # requests that haven't been sent yet.
+            for future in futures:
+                future.cancel()
+            raise
+
+    return results
+
+
+def _llm_classify_batch(
+    client: OpenAI, rows: List[Dict[str, Any]]
+) -> Dict[str, LlmClassificationResult]:
+    """
+        Send a single classification request for one batch of files.
+
+        The request uses structured outputs (LLM_RESPONSE_SCHEMA), so the model
+        is constrained to return a JSON object of the form:
+            {
+              "results": [
+                {
+                  "full_path": "<full_path>",
+                  "category": "<one_of_categories>",
+                  "confidence": <float_between_0_and_1>
+                },
+                ...
+              ]
+            }
+        The response is parsed and returned as a mapping:
+        full_path -> LlmClassificationResult.
+
+        Raises:
+        - LlmUnavailableError: if the OpenAI API call fails or times out.
+        - LlmResponseParseError: if the response cannot be parsed as expected.
+    """
+    # The fixed instructions come first so every batch shares the same prompt
+    # prefix (and can hit the API's prompt cache); only the file list varies.
+    prompt = _PROMPT_PREFIX + json.dumps(rows, indent=2) + "\n"
 
     try:
         response = client.responses.create(
             model="gpt-5.1",
             input=prompt,
+            text={"format": LLM_RESPONSE_SCHEMA},
         )
     except Exception as exc:
         # Wrap any client/network error as LlmUnavailableError so the CLI
         # can show a friendly message and abort safely.
         raise LlmUnavailableError(f"LLM API call failed: {exc}") from exc
 
-    # the textual output is in `output_text`.
+    # The schema guarantees well-formed JSON, but a refusal or truncated
+    # response can still leave output_text empty or incomplete.
     try:
-        raw_text = response.output_text
+        parsed = json.loads(response.output_text)
+        entries = parsed["results"]
     except Exception as exc:
         raise LlmResponseParseError(
-            f"Unexpected LLM response structure: {exc}"
+            f"Failed to parse structured LLM response: {exc}"
         ) from exc
 
-    # Parse the model's content as JSON.
+    results: Dict[str, LlmClassificationResult] = {}
+
     try:
-        parsed = json.loads(raw_text)
-    except Exception as exc:
+        # Category and confidence bounds are re-checked in bulk by
+        # classify_files(); this helper stays focused on I/O concerns.
+        for entry in entries:
+            results[entry["full_path"]] = LlmClassificationResult(
+                full_path=Path(entry["full_path"]),
+                category=str(entry["category"]),
+                confidence=float(entry["confidence"]),
+            )
+    except (KeyError, TypeError, ValueError) as exc:
         raise LlmResponseParseError(
-            f"Failed to parse LLM response as JSON: {exc}"
+            f"LLM response entry does not match the expected schema: {exc}"
         ) from exc
 
-    if not isinstance(parsed, dict):
-        raise LlmResponseParseError(
-            f"LLM response JSON must be an object mapping full_path -> result, got {type(parsed)}"
-        )
-
-    results: Dict[str, LlmClassificationResult] = {}
-
-    for full_path_str, info in parsed.items():
-        if not isinstance(info, dict):
-            # Skip malformed entries, but don't crash entire classification.
-            continue
-
-        category = info.get("category", "uncertain_review")
-        confidence_raw = info.get("confidence", 0.0)
-
-        # Best-effort numeric conversion + clamp.
-        try:
-            confidence = float(confidence_raw)
-        except (TypeError, ValueError):
-            confidence = 0.0
-
-        if confidence < 0.0:
-            confidence = 0.0
-        if confidence > 1.0:
-            confidence = 1.0
-
-        # If the model proposes a category not in allowed CATEGORIES, we still
-        # accept it here and let classify_files() normalize to 'uncertain_review'
-        # afterward. This keeps this helper focused on I/O concerns.
-        results[full_path_str] = LlmClassificationResult(
-            full_path=Path(full_path_str),
-            category=str(category),
-            confidence=confidence,
-        )
-
     return results
@@ -7,25 +7,36 @@ Responsibilities (MVP):
 - Take a PlanSummary + root path.
 - For each row in plan.df:
     - Compute target_dir = root / category
-    - Create directory if needed
-    - Move old_path -> new_path
+      (each category directory is created once, before any file is moved)
+    - Move old_path -> new_path (concurrently, on a thread pool)
     - Record outcome (success / failed: <reason> / skipped)
 - Build a moves DataFrame with:
     file_name, old_path, new_path, category, classifier_type, confidence, status
-- Pass move records to logger.write_move_log(...)
+- Pass the move outcomes (a column-wise MoveBatch) to logger.write_move_log(...)
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence, Tuple
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 
+import errno
+import os
 import shutil
+import numpy as np
 import pandas as pd
 
 from .errors import FileMoveError
-from .models import MoveRecord, PlanSummary
+from .models import MoveBatch, PlanSummary
 from .logger import write_move_log
 
+# Column order of the moves DataFrame returned by apply_plan().
+# Taken from MoveBatch.columns() so the two cannot drift apart.
+MOVE_COLUMNS: List[str] = list(MoveBatch.from_records(()).columns())
+
+# Maximum number of file moves in flight at once.
+MOVE_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
 def apply_plan(plan: PlanSummary, root_path: Path) -> tuple[pd.DataFrame, Path]:
     """
     Apply the organization plan by moving files into category subfolders.
@@ -36,14 +47,16 @@ def apply_plan(plan: PlanSummary, root_path: Path) -> tuple[pd.DataFrame, Path]:
         The plan to apply. Expects plan.df columns at least:
         - file_name, full_path, category, classifier_type, confidence
     root_path : Path
-        Root folder where category directories will be created.
+        Root folder where category directories will be created. Expected to
+        be absolute and already resolved (utils.paths.resolve_root), the same
+        root the plan's paths were scanned from; it is not re-resolved here.
 
     Returns
     -------
     (moves_df, log_path) : (pd.DataFrame, Path)
         moves_df includes one row per file attempt with columns:
             file_name, old_path, new_path, category, classifier_type, confidence, status
-        log_path is the CSV path written by logger.write_move_log(...)
+        log_path is the move log path written by logger.write_move_log(...)
 
     Raises
     ------
@@ -51,10 +64,11 @@ def apply_plan(plan: PlanSummary, root_path: Path) -> tuple[pd.DataFrame, Path]:
         For catastrophic failures that prevent execution from proceeding at all.
         (Most per-file failures are recorded in the move log and do not abort.)
     """
-    try:
-        root_path = Path(root_path)
-    except Exception as exc:
-        raise FileMoveError(f"Invalid root path: {root_path}") from exc
+    if not isinstance(root_path, Path):
+        try:
+            root_path = Path(root_path)
+        except Exception as exc:
+            raise FileMoveError(f"Invalid root path: {root_path}") from exc
 
     # Defensive: ensure plan.df exists and looks like a DataFrame.
     if plan is None or getattr(plan, "df", None) is None:
@@ -67,212 +81,292 @@ def apply_plan(plan: PlanSummary, root_path: Path) -> tuple[pd.DataFrame, Path]:
     if missing:
         raise FileMoveError(f"Plan DataFrame is missing required columns: {sorted(missing)}")
 
-    # Track category directory creation failures to avoid repeated mkdir attempts.
+    # Extract columns once as plain arrays; the loop below indexes into them
+    # instead of materializing a Series per row.
+    n = len(df)
+    file_names = df["file_name"].fillna("").astype(str).to_numpy(dtype=object)
+    old_paths = df["full_path"].to_numpy(dtype=object, na_value="")
+
+    # Normalize the log fields for all rows at once: classifier_type must be
+    # "rule" or "llm" (anything else is logged as "rule"), and confidence is
+    # a float, or None where missing/non-numeric.
+    classifier_type_col = df["classifier_type"]
+    classifier_types = (
+        classifier_type_col.where(classifier_type_col.isin(["rule", "llm"]), "rule")
+        .astype(str)
+        .to_numpy(dtype=object)
+    )
+    confidence_values = pd.to_numeric(df["confidence"], errors="coerce").to_numpy(
+        dtype=np.float64, na_value=np.nan
+    )
+    confidences = confidence_values.astype(object)
+    confidences[np.isnan(confidence_values)] = None
+
+    # Missing/blank categories go to "uncertain_review" (vectorized).
+    category_col = df["category"]
+    categories = np.where(
+        (category_col.isna() | category_col.isin(["", "nan"])).to_numpy(dtype=bool),
+        "uncertain_review",
+        category_col.astype(str).to_numpy(dtype=object),
+    ).astype(object)
+
+    # Create each category directory once, up front, instead of attempting a
+    # mkdir for every file. Failures are remembered per category and every
+    # file bound for that category is recorded as failed without a move.
+    target_dirs: Dict[str, Path] = {}
     category_dir_failures: Dict[str, str] = {}
 
-    move_records: List[MoveRecord] = []
-    move_rows: List[dict] = []
-
-    for _, row in df.iterrows():
-        file_name = str(row.get("file_name", ""))
-        old_path_raw = row.get("full_path", "")
-        category_raw = row.get("category", None)
-
-        category = str(category_raw) if category_raw not in (None, "", "nan") else "uncertain_review"
-        classifier_type = row.get("classifier_type", None)
-        confidence = row.get("confidence", None)
-
-        old_path = Path(str(old_path_raw))
-
-        target_dir = root_path / category
-        new_path = target_dir / old_path.name
-
-        status: str
-
-        # If category directory already known to fail, mark as failed quickly.
-        if category in category_dir_failures:
-            reason = category_dir_failures[category]
-            status = f"failed: {reason}"
-            _append_move(
-                move_records,
-                move_rows,
-                file_name=file_name,
-                old_path=old_path,
-                new_path=new_path,
-                category=category,
-                classifier_type=classifier_type,
-                confidence=confidence,
-                status=status,
-            )
-            continue
-
-        # Create category dir if needed.
+    for cat in pd.unique(categories):
+        target_dir = root_path / cat
+        target_dirs[cat] = target_dir
         try:
             target_dir.mkdir(parents=True, exist_ok=True)
         except Exception as exc:
-            reason = f"could not create target directory '{target_dir}': {exc}"
-            category_dir_failures[category] = reason
-            status = f"failed: {reason}"
-            _append_move(
-                move_records,
-                move_rows,
-                file_name=file_name,
-                old_path=old_path,
-                new_path=new_path,
-                category=category,
-                classifier_type=classifier_type,
-                confidence=confidence,
-                status=status,
-            )
+            category_dir_failures[cat] = f"could not create target directory '{target_dir}': {exc}"
+
+    old_path_list = [Path(str(p)) for p in old_paths]
+    new_paths: List[Path] = [
+        target_dirs[categories[i]] / old_path_list[i].name for i in range(n)
+    ]
+    statuses: List[str] = [""] * n
+
+    # Files bound for a category whose directory could not be created fail
+    # up front, in bulk, one category at a time; only the remaining rows are
+    # moved, concurrently (moves are syscall-bound and release the GIL).
+    # Rows are handled grouped by category (stable sort, so plan order within
+    # each category), so consecutive rows share a target directory and name
+    # snapshot. Results are written back by index, so moves_df and the log
+    # keep the plan's row order.
+    failed_mask = np.isin(categories, list(category_dir_failures))
+
+    for cat, reason in category_dir_failures.items():
+        status = f"failed: {reason}"
+        for i in np.flatnonzero(categories == cat).tolist():
+            statuses[i] = status
+
+    order = np.argsort(categories, kind="stable")
+    pending: List[int] = order[~failed_mask[order]].tolist()
+
+    # Per-category snapshot of the names already in its directory (one
+    # scandir per category). Collision-free names are picked against the
+    # snapshot in memory and added to it, so later files see them. A
+    # directory that can't be listed falls back to checking candidates on
+    # disk.
+    existing: Dict[str, Set[str]] = {}
+    check_disk: Dict[str, bool] = {}
+    next_index: Dict[str, Dict[Tuple[str, str], int]] = {}
+    for cat, target_dir in target_dirs.items():
+        if cat in category_dir_failures:
             continue
+        names = _list_names(target_dir)
+        existing[cat] = names if names is not None else set()
+        check_disk[cat] = names is None
+        next_index[cat] = {}
+
+    def _resolve(i: int) -> None:
+        category = categories[i]
+        new_paths[i] = _resolve_collision(
+            target_dirs[category] / old_path_list[i].name,
+            existing[category],
+            check_disk=check_disk[category],
+            next_index=next_index[category],
+        )
 
+    # Every target name is chosen here, in the main thread and in plan order,
+    # so a run always maps the same sources to the same names; the workers
+    # only carry out the fixed (src, dst) moves.
+    to_move: List[int] = []
+    for i in pending:
+        old_path = old_path_list[i]
         # If old path doesn't exist, treat as per-file failure.
         if not old_path.exists():
-            status = "failed: source file not found"
-            _append_move(
-                move_records,
-                move_rows,
-                file_name=file_name,
-                old_path=old_path,
-                new_path=new_path,
-                category=category,
-                classifier_type=classifier_type,
-                confidence=confidence,
-                status=status,
-            )
-            continue
-
-        # Avoid moving a file onto itself.
-        try:
-            if old_path.resolve() == new_path.resolve():
-                status = "skipped: already in target"
-                _append_move(
-                    move_records,
-                    move_rows,
-                    file_name=file_name,
-                    old_path=old_path,
-                    new_path=new_path,
-                    category=category,
-                    classifier_type=classifier_type,
-                    confidence=confidence,
-                    status=status,
-                )
-                continue
-        except Exception:
-            # If resolve fails (permissions/symlinks), just proceed with best-effort move.
-            pass
-
-        # If destination exists, pick a non-colliding filename.
-        new_path_final = _resolve_collision(new_path)
-
-        # Perform move (per-file failure should not abort).
-        try:
-            shutil.move(str(old_path), str(new_path_final))
-            status = "success"
-        except Exception as exc:
-            status = f"failed: {exc}"
-
-        _append_move(
-            move_records,
-            move_rows,
-            file_name=file_name,
-            old_path=old_path,
-            new_path=new_path_final,
-            category=category,
-            classifier_type=classifier_type,
-            confidence=confidence,
-            status=status,
-        )
+            statuses[i] = "failed: source file not found"
+        # Avoid moving a file onto itself. new_path is target_dir /
+        # old_path.name, so this can only happen when the file already sits
+        # in its target dir; a plain path comparison replaces resolving both
+        # paths.
+        elif old_path.parent == new_paths[i].parent:
+            statuses[i] = "skipped: already in target"
+        else:
+            _resolve(i)
+            to_move.append(i)
+
+    def _move(i: int) -> Optional[str]:
+        return _move_file(old_path_list[i], new_paths[i])
+
+    # A target that turns out to exist on disk (created after the snapshot,
+    # or a case variant of a snapshot name on a case-insensitive filesystem
+    # such as APFS or NTFS) is left untouched; its name is already in the snapshot,
+    # so those rows get the next free names, again in plan order, and are
+    # moved in another round.
+    while to_move:
+        if len(to_move) > 1:
+            with ThreadPoolExecutor(max_workers=min(MOVE_MAX_WORKERS, len(to_move))) as pool:
+                outcomes = list(pool.map(_move, to_move))
+        else:
+            outcomes = [_move(i) for i in to_move]
+
+        retry: List[int] = []
+        for i, status in zip(to_move, outcomes):
+            if status is None:
+                _resolve(i)
+                retry.append(i)
+            else:
+                statuses[i] = status
+        to_move = retry
+
+    # Move outcomes are kept column-wise (one list per field) rather than as
+    # one MoveRecord per file; the moves DataFrame and the log both read the
+    # same columns.
+    batch = MoveBatch(
+        file_names=file_names.tolist(),
+        old_paths=[str(p) for p in old_path_list],
+        new_paths=[str(p) for p in new_paths],
+        categories=categories.tolist(),
+        classifier_types=classifier_types.tolist(),
+        confidences=confidences.tolist(),
+        statuses=statuses,
+    )
 
     # Build DataFrame for callers / future summarization needs.
-    moves_df = pd.DataFrame(
-        move_rows,
-        columns=[
-            "file_name",
-            "old_path",
-            "new_path",
-            "category",
-            "classifier_type",
-            "confidence",
-            "status",
-        ],
-    )
+    moves_df = pd.DataFrame(batch.columns(), columns=MOVE_COLUMNS)
 
-    # Write CSV log using logger (expects MoveRecord sequence based on your logger.py).
-    log_path = write_move_log(move_records, root_path=root_path)
+    # Write the move log using logger.
+    log_path = write_move_log(batch, root_path=root_path)
 
     return moves_df, log_path
 
 
-def _resolve_collision(path: Path) -> Path:
+def _move_file(old_path: Path, new_path: Path) -> Optional[str]:
     """
-    If 'path' already exists, produce a new Path by appending ' (n)' before suffix.
+    Move one file to its already-resolved target (runs on a move worker
+    thread).
 
-    Example:
-      report.pdf -> report (1).pdf -> report (2).pdf
+    Returns the status ("success" or "failed: ..."), or None if new_path
+    already exists on disk; the move never replaces an existing file, and the
+    caller picks another name.
     """
-    if not path.exists():
-        return path
+    # Perform move (per-file failure should not abort).
+    try:
+        _move_path(str(old_path), str(new_path))
+        return "success"
+    except FileExistsError:
+        return None
+    except Exception as exc:
+        return f"failed: {exc}"
 
-    parent = path.parent
-    stem = path.stem
-    suffix = path.suffix
 
-    i = 1
-    while True:
-        candidate = parent / f"{stem} ({i}){suffix}"
-        if not candidate.exists():
-            return candidate
-        i += 1
+def _move_path(src: str, dst: str) -> None:
+    """
+    Move src to dst without ever replacing an existing dst.
+
+    On the same filesystem (the usual case, since targets live under the
+    scanned root) this is a hard link to dst followed by unlinking src: the
+    link fails with FileExistsError if dst exists, where os.replace would
+    silently overwrite it. Across filesystems (EXDEV) or where hard links
+    are not permitted (EPERM), falls back to shutil.move's copy + delete
+    after checking that dst is free.
+    """
+    try:
+        os.link(src, dst)
+    except OSError as exc:
+        if exc.errno not in (errno.EXDEV, errno.EPERM):
+            raise
+        if os.path.lexists(dst):
+            raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), dst)
+        shutil.move(src, dst)
+        return
 
+    try:
+        os.unlink(src)
+    except OSError:
+        # Leave the file where it was rather than in both places.
+        os.unlink(dst)
+        raise
 
-def _append_move(
-    record_list: List[MoveRecord],
-    row_list: List[dict],
-    *,
-    file_name: str,
-    old_path: Path,
-    new_path: Path,
-    category: str,
-    classifier_type: object,
-    confidence: object,
-    status: str,
-) -> None:
+
+def _list_names(directory: Path) -> Optional[Set[str]]:
     """
-    Append a MoveRecord (for logger) and a dict row (for moves_df).
+    Return the set of entry names in 'directory' (a single scandir), or None
+    if it cannot be listed.
     """
-    # Normalize classifier_type to the expected literals if possible.
-    cls_type: str
-    if classifier_type in ("rule", "llm"):
-        cls_type = str(classifier_type)
-    else:
-        cls_type = str(classifier_type) if classifier_type is not None else "rule"
-
-    conf_val: Optional[float]
     try:
-        conf_val = None if confidence is None else float(confidence)
-    except Exception:
-        conf_val = None
-
-    record = MoveRecord(
-        file_name=file_name,
-        old_path=old_path,
-        new_path=new_path,
-        category=category,
-        classifier_type=cls_type,  # type: ignore[arg-type]
-        confidence=conf_val,
-        status=status,
-    )
-    record_list.append(record)
-
-    row_list.append(
-        {
-            "file_name": file_name,
-            "old_path": str(old_path),
-            "new_path": str(new_path),
-            "category": category,
-            "classifier_type": cls_type,
-            "confidence": conf_val,
-            "status": status,
-        }
-    )
+        with os.scandir(directory) as it:
+            return {entry.name for entry in it}
+    except OSError:
+        return None
+
+
+def _resolve_collision(
+    path: Path,
+    existing: Set[str],
+    *,
+    check_disk: bool = False,
+    next_index: Optional[Dict[Tuple[str, str], int]] = None,
+) -> Path:
+    """
+    If 'path' is taken, produce a new Path by appending ' (n)' before suffix.
+
+    A name is taken if it is in 'existing' (a snapshot of the target
+    directory's names plus those already chosen this run) or, with
+    check_disk=True, if it exists on disk. The chosen name is added to
+    'existing' so later files in the same directory see it.
+
+    Names are compared exactly. On a case-insensitive filesystem a case
+    variant of an existing name is caught when the move itself fails with
+    FileExistsError (see _move_path), and the file is given the next name.
+
+    Against the in-memory set the lowest free n is chosen. 'next_index', if
+    given, remembers per (stem, suffix) where the previous search stopped;
+    names are never removed from 'existing', so every n below that is still
+    taken and the scan resumes there instead of restarting at 1.
+
+    With check_disk=True (no snapshot, every check is a stat call),
+    candidates are instead probed at n = 1, 2, 4, 8, ... until one is free,
+    then binary-searched back down to the first free n after the taken run:
+    O(log N) stat calls instead of O(N). When the taken names form a
+    contiguous run (the usual case) this is also the lowest free n.
+
+    Example:
+      report.pdf -> report (1).pdf -> report (2).pdf
+    """
+    parent = path.parent
+
+    def taken(name: str) -> bool:
+        return name in existing or (
+            check_disk and os.path.lexists(parent / name)
+        )
+
+    name = path.name
+    if taken(name):
+        stem = path.stem
+        suffix = path.suffix
+
+        def candidate(i: int) -> str:
+            return f"{stem} ({i}){suffix}"
+
+        if check_disk:
+            # Exponential probe: find hi with candidate(hi) free; lo is taken (or 0).
+            lo, hi = 0, 1
+            while taken(candidate(hi)):
+                lo, hi = hi, hi * 2
+
+            # Binary search in (lo, hi] for the first free candidate.
+            while hi - lo > 1:
+                mid = (lo + hi) // 2
+                if taken(candidate(mid)):
+                    lo = mid
+                else:
+                    hi = mid
+            i = hi
+        else:
+            key = (stem, suffix)
+            i = next_index.get(key, 1) if next_index is not None else 1
+            while taken(candidate(i)):
+                i += 1
+            if next_index is not None:
+                next_index[key] = i + 1
+        name = candidate(i)
+
+    existing.add(name)
+    return parent / name
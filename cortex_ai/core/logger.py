@@ -3,23 +3,26 @@ from __future__ import annotations
 Move log writer for the AI Folder Organizer.
 
 Responsibilities:
-- Write a CSV log of move outcomes.
+- Write a log of move outcomes: CSV by default, or Parquet (columnar,
+  compressed; requires pyarrow) on request.
 
 Expected usage:
-- The executor builds a list[MoveRecord] while moving files.
+- The executor builds a MoveBatch (column-wise move outcomes) while moving
+  files; an iterable of MoveRecord is accepted as well.
 - At the end, call write_move_log(records, root_path) and then print the path
   using console.print_move_log_written(...).
 """
 
-from dataclasses import asdict
+import csv
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable, List, Sequence
+from importlib.util import find_spec
+from typing import Iterable, List, Literal
 
 import pandas as pd
 
 from .errors import LoggingError
-from .models import MoveRecord
+from .models import MoveBatch, MoveRecord
 
 # ---------------------------------------------------------------------------
 # Defaults
@@ -30,50 +33,76 @@ DEFAULT_LOG_DIRNAME = ".organizer"
 DEFAULT_LOG_SUBDIR = "logs"
 DEFAULT_LOG_PREFIX = "move_log"
 
+LogFormat = Literal["csv", "parquet"]
+
+# CSV regardless of installed packages, so tools reading the logs can rely on
+# the format; Parquet is opt-in through write_move_log(fmt="parquet").
+DEFAULT_LOG_FORMAT: LogFormat = "csv"
+
+# Column order of the written log.
+# Taken from MoveBatch.columns() so the two cannot drift apart.
+LOG_COLUMNS: List[str] = list(MoveBatch.from_records(()).columns())
+
 def write_move_log(
-    records: Sequence[MoveRecord] | Iterable[MoveRecord],
+    records: MoveBatch | Iterable[MoveRecord],
     root_path: Path,
     *,
     log_dirname: str = DEFAULT_LOG_DIRNAME,
     log_subdir: str = DEFAULT_LOG_SUBDIR,
     filename_prefix: str = DEFAULT_LOG_PREFIX,
+    fmt: LogFormat = DEFAULT_LOG_FORMAT,
 ) -> Path:
     """
-    Write a CSV move log and return the written file path.
+    Write a move log and return the written file path.
 
     The log is written under:
-        {root_path}/{log_dirname}/{log_subdir}/{filename_prefix}_YYYYmmdd_HHMMSSZ.csv
+        {root_path}/{log_dirname}/{log_subdir}/{filename_prefix}_YYYYmmdd_HHMMSSZ.{parquet|csv}
 
-    Always write a CSV file (even if there are 0 records) so the CLI can
+    Always write a log file (even if there are 0 records) so the CLI can
     reliably report a log path.
 
     Parameters
     ----------
     records:
-        Iterable of MoveRecord entries (can be empty).
+        MoveBatch of move outcomes, or an iterable of MoveRecord entries
+        (either can be empty).
     root_path:
-        The scan/organize root directory where logs should live.
+        The scan/organize root directory where logs should live. Expected to
+        be an absolute, already resolved Path (as passed on by apply_plan).
     log_dirname:
         Top-level hidden directory under root (default: ".organizer").
     log_subdir:
         Subdirectory under log_dirname for logs (default: "logs").
     filename_prefix:
         Prefix for the log filename (default: "move_log").
+    fmt:
+        "csv" for a human-readable log (default) or "parquet"
+        (zstd-compressed, requires pyarrow).
 
     Returns
     -------
     Path
-        The path to the written CSV file.
+        The path to the written log file.
 
     Raises
     ------
     LoggingError
-        If the log directory cannot be created or the file cannot be written.
+        If the log directory cannot be created or the file cannot be written,
+        if fmt is not a supported format, or if fmt is "parquet" and pyarrow
+        is not installed.
     """
-    try:
-        root_path = Path(root_path)
-    except Exception as exc:
-        raise LoggingError(f"Invalid root path for logging: {root_path}") from exc
+    if fmt not in ("csv", "parquet"):
+        raise LoggingError(f"Unsupported move log format: {fmt!r}")
+    if fmt == "parquet" and find_spec("pyarrow") is None:
+        raise LoggingError(
+            "Parquet move logs require pyarrow. Install it or use fmt='csv'."
+        )
+
+    if not isinstance(root_path, Path):
+        try:
+            root_path = Path(root_path)
+        except Exception as exc:
+            raise LoggingError(f"Invalid root path for logging: {root_path}") from exc
 
     # Prepare destination directory.
     log_dir = root_path / log_dirname / log_subdir
@@ -84,44 +113,47 @@ def write_move_log(
 
     # Timestamped filename (UTC) for stable ordering.
     ts = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%SZ")
-    log_path = log_dir / f"{filename_prefix}_{ts}.csv"
-
-    # Normalize records to a list so we can iterate safely multiple times.
+    log_path = log_dir / f"{filename_prefix}_{ts}.{fmt}"
+
+    # Normalize records to a column-wise batch.
+    if isinstance(records, MoveBatch):
+        batch = records
+    else:
+        try:
+            batch = MoveBatch.from_records(records)
+        except Exception as exc:
+            raise LoggingError("Failed to materialize move records for logging.") from exc
+
+    # Write the log
     try:
-        record_list: List[MoveRecord] = list(records)
+        if fmt == "parquet":
+            _write_parquet(log_path, batch)
+        else:
+            _write_csv(log_path, batch)
     except Exception as exc:
-        raise LoggingError("Failed to materialize move records for logging.") from exc
-
-    # Convert to DataFrame with stable, explicit column order.
-    rows = []
-    for r in record_list:
-        d = asdict(r)
+        raise LoggingError(f"Failed to write move log to '{log_path}'.") from exc
 
-        # Ensure Paths serialize as strings
-        d["old_path"] = str(r.old_path)
-        d["new_path"] = str(r.new_path)
+    return log_path
 
-        # Confidence can be None; keep as-is (pandas will write blank)
-        d["confidence"] = r.confidence
 
-        rows.append(d)
+def _write_csv(log_path: Path, batch: MoveBatch) -> None:
+    """
+    Stream the batch to a CSV file row by row (no intermediate DataFrame).
 
-    columns = [
-        "file_name",
-        "old_path",
-        "new_path",
-        "category",
-        "classifier_type",
-        "confidence",
-        "status",
-    ]
+    A None confidence is written as a blank cell.
+    """
+    with open(log_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(LOG_COLUMNS)
+        writer.writerows(zip(*batch.columns().values()))
 
-    df = pd.DataFrame(rows, columns=columns)
 
-    # Write CSV
-    try:
-        df.to_csv(log_path, index=False)
-    except Exception as exc:
-        raise LoggingError(f"Failed to write move log to '{log_path}'.") from exc
+def _write_parquet(log_path: Path, batch: MoveBatch) -> None:
+    """
+    Write the batch to a zstd-compressed Parquet file (requires pyarrow).
 
-    return log_path
\ No newline at end of file
+    The batch's columns are used as-is; a None confidence is written as a
+    null.
+    """
+    df = pd.DataFrame(batch.columns(), columns=LOG_COLUMNS)
+    df.to_parquet(log_path, engine="pyarrow", compression="zstd", index=False)
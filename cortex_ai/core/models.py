@@ -7,14 +7,18 @@ These dataclasses define the structured data passed between:
 and allow the console layer (Rich output) to render summaries without
 knowing internal implementation details.
 
-They are intentionally small, immutable-ish containers with no heavy logic.
+They are intentionally small containers with no heavy logic. The per-file and
+per-category records are frozen and use __slots__ (no per-instance __dict__),
+since runs create one per file; PlanSummary stays a plain mutable dataclass.
 """
 
 from dataclasses import dataclass
+from importlib.util import find_spec
 from pathlib import Path
-from typing import List, Optional, Literal
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Literal
 
-import pandas as pd
+if TYPE_CHECKING:  # annotations only; keeps importing the models cheap
+    import pandas as pd
 
 # ---------------------------------------------------------------------------
 # Basic types
@@ -22,7 +26,11 @@ import pandas as pd
 
 ClassifierType = Literal["rule", "llm"]
 
-@dataclass
+# pandas dtype for string columns (file names, paths, categories). Arrow-backed
+# strings when pyarrow is installed, pandas' own string dtype otherwise.
+STRING_DTYPE = "string[pyarrow]" if find_spec("pyarrow") is not None else "string"
+
+@dataclass(slots=True, frozen=True)
 class FileRecord:
     """
     Metadata for a single file discovered during scanning.
@@ -37,7 +45,7 @@ class FileRecord:
     size_bytes: int
     modified_time: float  # POSIX timestamp (time.time() / stat.st_mtime)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LlmClassificationResult:
     """
     Result of classifying a single file via the LLM.
@@ -55,7 +63,7 @@ class LlmClassificationResult:
 # Planning / summary models
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PlanCategorySummary:
     """
     Aggregated summary for a single category in the proposed organization plan.
@@ -99,13 +107,13 @@ class PlanSummary:
 # Move logging models
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MoveRecord:
     """
     Represents the outcome of moving a single file when applying a plan.
 
-    This is the in-memory representation that can be converted to a DataFrame
-    and written out as a CSV move log.
+    Single-file view of a move outcome; a whole run is kept column-wise in a
+    MoveBatch (see MoveBatch.from_records()).
 
     - file_name
     - old_path
@@ -123,3 +131,58 @@ class MoveRecord:
     classifier_type: ClassifierType
     confidence: Optional[float]
     status: str
+
+@dataclass(slots=True)
+class MoveBatch:
+    """
+    Outcomes of applying a plan, stored column-wise.
+
+    One list per field, aligned by index (row i is one file), instead of one
+    MoveRecord object per file. This is what the executor builds and what the
+    log writer and moves DataFrame consume; paths are kept as strings.
+
+    - file_names
+    - old_paths
+    - new_paths
+    - categories
+    - classifier_types
+    - confidences
+    - statuses (e.g. 'success', 'failed: <reason>')
+    """
+
+    file_names: List[str]
+    old_paths: List[str]
+    new_paths: List[str]
+    categories: List[str]
+    classifier_types: List[ClassifierType]
+    confidences: List[Optional[float]]
+    statuses: List[str]
+
+    def __len__(self) -> int:
+        return len(self.file_names)
+
+    @classmethod
+    def from_records(cls, records: Iterable[MoveRecord]) -> "MoveBatch":
+        """Build a batch from individual MoveRecords."""
+        batch = cls([], [], [], [], [], [], [])
+        for r in records:
+            batch.file_names.append(r.file_name)
+            batch.old_paths.append(str(r.old_path))
+            batch.new_paths.append(str(r.new_path))
+            batch.categories.append(r.category)
+            batch.classifier_types.append(r.classifier_type)
+            batch.confidences.append(r.confidence)
+            batch.statuses.append(r.status)
+        return batch
+
+    def columns(self) -> Dict[str, list]:
+        """Return the columns keyed by move log column name, in log order."""
+        return {
+            "file_name": self.file_names,
+            "old_path": self.old_paths,
+            "new_path": self.new_paths,
+            "category": self.categories,
+            "classifier_type": self.classifier_types,
+            "confidence": self.confidences,
+            "status": self.statuses,
+        }
@@ -30,7 +30,7 @@ include at least:
 """
 
 from pathlib import Path
-from typing import List, Optional
+from typing import List
 
 import numpy as np
 import pandas as pd
@@ -39,6 +39,20 @@ from .errors import ClassificationError
 from .models import PlanSummary, PlanCategorySummary
 from .classifier import CATEGORIES
 
+# Columns build_plan() requires on its input DataFrame.
+_PLAN_REQUIRED = frozenset(
+    {
+        "file_name",
+        "extension",
+        "full_path",
+        "size_bytes",
+        "modified_time",
+        "category",
+        "classifier_type",
+        "confidence",
+    }
+)
+
 def build_plan(df: pd.DataFrame, root_path: Path) -> PlanSummary:
     """
     Build a PlanSummary from a classified DataFrame and root path.
@@ -60,90 +74,68 @@ def build_plan(df: pd.DataFrame, root_path: Path) -> PlanSummary:
     ClassificationError
         If the DataFrame is missing required classification columns.
     """
-    required_columns = {
-        "file_name",
-        "extension",
-        "full_path",
-        "size_bytes",
-        "modified_time",
-        "category",
-        "classifier_type",
-        "confidence",
-    }
-    missing = required_columns.difference(df.columns)
-    if missing:
+    if not _PLAN_REQUIRED.issubset(df.columns):
+        missing = _PLAN_REQUIRED.difference(df.columns)
         raise ClassificationError(
             f"DataFrame is missing required columns for planning: {sorted(missing)}"
         )
 
-    # Work on a copy to avoid surprising callers.
-    df = df.copy()
-
-    # Ensure types we rely on are sensible.
-    df["size_bytes"] = df["size_bytes"].astype(float)
+    # The input frame is neither copied nor modified: numeric conversions are
+    # done on local arrays/Series and the original df goes into the plan.
+    category = df["category"]
+    sizes = df["size_bytes"].to_numpy(dtype=np.float64, copy=False)
     # confidence may be None / NaN; keep as numeric where possible.
-    df["confidence"] = pd.to_numeric(df["confidence"], errors="coerce")
+    confidence = pd.to_numeric(df["confidence"], errors="coerce")
 
     # Global stats
     total_files = int(len(df))
-    total_size_mb = float(df["size_bytes"].sum() / (1024 * 1024))
-
-    num_uncertain = int((df["category"] == "uncertain_review").sum())
-
-    # Per-category summaries
-    categories: List[PlanCategorySummary] = []
-
-    # Group by category; skip rows without a category just in case.
-    grouped = df.dropna(subset=["category"]).groupby("category", sort=False)
-
-    # Iterate categories in the canonical order from CATEGORIES, but only if present,
-    # then add any unexpected categories (for robustness).
-    seen = set()
-
-    def _make_summary_for_category(cat: str) -> Optional[PlanCategorySummary]:
-        if cat not in grouped.groups:
-            return None
-        group = grouped.get_group(cat)
-
-        file_count = int(len(group))
-        total_size_mb_cat = float(group["size_bytes"].sum() / (1024 * 1024))
+    total_size_mb = float(sizes.sum() / (1024 * 1024))
+
+    # One counting pass over the category column drives num_uncertain, the
+    # per-category file counts and which categories are present. Rows without
+    # a category are skipped (value_counts/groupby drop missing keys).
+    counts = category.value_counts(sort=False)
+    num_uncertain = int(counts.get("uncertain_review", 0))
+
+    # For avg_confidence we consider all non-null confidence values
+    # (these are primarily LLM-based, but rule-based entries may have 1.0 too).
+    # Sample filenames: up to 3 per category (stable order by file_name for
+    # determinism), taken from one sort of the (category, file_name) columns.
+    # Sorting and grouping the frame itself keeps rows and keys together, so
+    # a non-unique index (e.g. concatenated scans) needs no realignment.
+    stats = pd.DataFrame(
+        {
+            "file_count": counts,
+            "size_bytes": df["size_bytes"].groupby(category, sort=False).sum(),
+            "avg_confidence": confidence.groupby(category, sort=False).mean(),
+            "sample_files": (
+                df[["category", "file_name"]]
+                .sort_values("file_name")
+                .groupby("category", sort=False)
+                .head(3)
+                .groupby("category", sort=False)["file_name"]
+                .agg(list)
+            ),
+        }
+    )
 
-        # For avg_confidence we consider all non-null confidence values
-        # (these are primarily LLM-based, but rule-based entries may have 1.0 too).
-        confidences = group["confidence"].dropna()
-        avg_confidence: Optional[float]
-        if len(confidences) == 0:
-            avg_confidence = None
-        else:
-            avg_confidence = float(confidences.mean())
+    # Known categories first, in the canonical order from CATEGORIES, then any
+    # unexpected categories the classifier might have produced (for robustness).
+    order = [cat for cat in CATEGORIES if cat in counts.index]
+    order += [cat for cat in counts.index if cat not in CATEGORIES]
 
-        # Pick up to 3 sample filenames (stable order by file_name for determinism).
-        sample_files = (
-            group.sort_values("file_name")["file_name"].head(3).astype(str).tolist()
-        )
-
-        return PlanCategorySummary(
+    categories: List[PlanCategorySummary] = [
+        PlanCategorySummary(
             category=cat,
-            file_count=file_count,
-            total_size_mb=total_size_mb_cat,
-            avg_confidence=avg_confidence,
-            sample_files=sample_files,
+            file_count=int(file_count),
+            total_size_mb=float(size_bytes / (1024 * 1024)),
+            avg_confidence=None if pd.isna(avg_confidence) else float(avg_confidence),
+            sample_files=[str(name) for name in sample_files],
         )
-
-    # First, use known categories in a friendly, stable order.
-    for cat in CATEGORIES:
-        summary = _make_summary_for_category(cat)
-        if summary is not None:
-            categories.append(summary)
-            seen.add(cat)
-
-    # Then, handle any unexpected categories the classifier might have produced.
-    for cat in grouped.groups.keys():
-        if cat in seen:
-            continue
-        summary = _make_summary_for_category(cat)
-        if summary is not None:
-            categories.append(summary)
+        for cat, file_count, size_bytes, avg_confidence, sample_files in (
+            stats.loc[order].itertuples(name=None)
+        )
+    ]
 
     # Build and return final PlanSummary
     plan = PlanSummary(
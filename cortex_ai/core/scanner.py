@@ -17,14 +17,31 @@ Responsibilities:
 - If there are no files under PATH, raise NoFilesFoundError.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
-from typing import List
+from typing import Iterable, Iterator, List, Tuple
 
 import os
+import numpy as np
 import pandas as pd
 
+try:  # Optional: build the frame from Arrow buffers when pyarrow is present.
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - depends on the environment
+    pa = None
+
 from .errors import PathNotFoundError, PathNotDirectoryError, NoFilesFoundError
-from .models import FileRecord
+from .models import STRING_DTYPE
+
+# Multi-part suffixes reported as a single extension (".tar.gz", not ".gz").
+_MULTIPART_SUFFIXES = (".tar.gz", ".tar.bz2", ".tar.xz")
+
+# Maximum number of top-level subdirectories walked concurrently.
+SCAN_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Per-column lists built while scanning: (names, extensions, paths, sizes, mtimes).
+_Columns = Tuple[List[str], List[str], List[str], List[int], List[float]]
 
 def scan_directory(root: Path) -> pd.DataFrame:
     """
@@ -33,7 +50,8 @@ def scan_directory(root: Path) -> pd.DataFrame:
     The returned DataFrame has columns:
 
     - file_name       (str)
-    - extension       (str; lowercase, including leading dot, e.g. ".pdf")
+    - extension       (str; lowercase, including leading dot, e.g. ".pdf";
+                       archive suffixes like ".tar.gz" are kept whole)
     - full_path       (str; absolute path)
     - size_bytes      (int)
     - modified_time   (float; POSIX timestamp)
@@ -70,58 +88,178 @@ def scan_directory(root: Path) -> pd.DataFrame:
     if not root.is_dir():
         raise PathNotDirectoryError(f"Provided path is not a directory: {root}")
 
-    records: List[FileRecord] = []
+    # Files directly under root are collected here; each top-level subtree is
+    # walked (scandir + stat, both GIL-releasing) on a worker thread. Parts
+    # keep os.walk order: root files first, then subdirectories in turn.
+    root_files, subdirs = _list_dir(str(root))
+    parts: List[_Columns] = [_collect(root_files)]
 
-    # Recursively walk the directory tree.
-    for dirpath, dirnames, filenames in os.walk(root):
-        dir_path = Path(dirpath)
-
-        for name in filenames:
-            full_path = dir_path / name
-
-            # Best-effort stat; if a file disappears between walk and stat or
-            # is otherwise inaccessible, we simply skip it rather than failing
-            # the entire scan.
-            try:
-                stat = full_path.stat()
-            except OSError:
-                # You could log this in verbose mode later if desired.
-                continue
+    if len(subdirs) > 1:
+        with ThreadPoolExecutor(max_workers=min(SCAN_MAX_WORKERS, len(subdirs))) as pool:
+            parts.extend(pool.map(_collect_tree, subdirs))
+    else:
+        parts.extend(_collect_tree(subdir) for subdir in subdirs)
 
-            record = FileRecord(
-                file_name=name,
-                extension=full_path.suffix.lower(),
-                full_path=full_path,
-                size_bytes=stat.st_size,
-                modified_time=stat.st_mtime,
-            )
-            records.append(record)
+    # Concatenate the per-part lists column by column.
+    names, extensions, paths, sizes, mtimes = (
+        list(chain.from_iterable(column_parts)) for column_parts in zip(*parts)
+    )
 
-    if not records:
+    if not names:
         # No files found anywhere under root.
         raise NoFilesFoundError(f"No files found under '{root}'.")
 
-    # Convert dataclasses into a DataFrame with the required columns.
-    data = [
+    df = _build_frame(names, extensions, paths, sizes, mtimes)
+
+    return df
+
+
+def _build_frame(
+    names: List[str],
+    extensions: List[str],
+    paths: List[str],
+    sizes: List[int],
+    mtimes: List[float],
+) -> pd.DataFrame:
+    """
+    Assemble the scan DataFrame from per-column lists.
+
+    With pyarrow available, each column is filled straight into a typed Arrow
+    buffer and pandas wraps the resulting table: string columns stay
+    Arrow-backed and the numeric columns become plain int64/float64 NumPy
+    columns. Otherwise the columns are built as typed pandas/NumPy arrays.
+    """
+    if pa is not None:
+        table = pa.table(
+            {
+                "file_name": pa.array(names, type=pa.string()),
+                "extension": pa.array(extensions, type=pa.string()),
+                "full_path": pa.array(paths, type=pa.string()),
+                "size_bytes": pa.array(sizes, type=pa.int64()),
+                "modified_time": pa.array(mtimes, type=pa.float64()),
+            }
+        )
+        return table.to_pandas(types_mapper=_arrow_types_mapper)
+
+    # Same-length typed arrays let pandas skip per-record dtype inference.
+    return pd.DataFrame(
         {
-            "file_name": r.file_name,
-            "extension": r.extension,
-            "full_path": str(r.full_path),
-            "size_bytes": r.size_bytes,
-            "modified_time": r.modified_time,
+            "file_name": pd.array(names, dtype=STRING_DTYPE),
+            "extension": pd.array(extensions, dtype=STRING_DTYPE),
+            "full_path": pd.array(paths, dtype=STRING_DTYPE),
+            "size_bytes": np.asarray(sizes, dtype=np.int64),
+            "modified_time": np.asarray(mtimes, dtype=np.float64),
         }
-        for r in records
-    ]
-
-    df = pd.DataFrame(
-        data,
-        columns=[
-            "file_name",
-            "extension",
-            "full_path",
-            "size_bytes",
-            "modified_time",
-        ],
     )
 
-    return df
\ No newline at end of file
+
+def _arrow_types_mapper(arrow_type: "pa.DataType"):
+    """Map Arrow strings to STRING_DTYPE; numeric types use NumPy defaults."""
+    if pa.types.is_string(arrow_type):
+        return pd.StringDtype("pyarrow")
+    return None
+
+
+def _collect_tree(path: str) -> _Columns:
+    """Walk and stat every file under `path` (runs on a scan worker thread)."""
+    return _collect(_walk(path))
+
+
+def _collect(entries: Iterable[os.DirEntry]) -> _Columns:
+    """
+    Stat each entry and return per-column lists:
+    (names, extensions, paths, sizes, mtimes).
+    """
+    names: List[str] = []
+    extensions: List[str] = []
+    paths: List[str] = []
+    sizes: List[int] = []
+    mtimes: List[float] = []
+
+    for entry in entries:
+        # Best-effort stat; if a file disappears between walk and stat or
+        # is otherwise inaccessible, we simply skip it rather than failing
+        # the entire scan.
+        try:
+            stat = entry.stat()
+        except OSError:
+            # You could log this in verbose mode later if desired.
+            continue
+
+        name = entry.name
+
+        names.append(name)
+        extensions.append(_extension_of(name))
+        paths.append(entry.path)
+        sizes.append(stat.st_size)
+        mtimes.append(stat.st_mtime)
+
+    return names, extensions, paths, sizes, mtimes
+
+
+def _walk(path: str) -> Iterator[os.DirEntry]:
+    """
+    Recursively yield a DirEntry for every non-directory entry under `path`.
+
+    Matches os.walk's defaults and order: a directory's files come before its
+    subdirectories, symlinked directories are not followed, and directories
+    that cannot be listed are silently skipped.
+    """
+    files, subdirs = _list_dir(path)
+    yield from files
+
+    for subdir in subdirs:
+        yield from _walk(subdir)
+
+
+def _list_dir(path: str) -> Tuple[List[os.DirEntry], List[str]]:
+    """
+    Split one directory listing into (file entries, subdirectory paths).
+
+    Symlinked directories are dropped rather than followed; an unreadable
+    directory yields two empty lists.
+    """
+    files: List[os.DirEntry] = []
+    subdirs: List[str] = []
+
+    try:
+        it = os.scandir(path)
+    except OSError:
+        return files, subdirs
+
+    with it:
+        for entry in it:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+
+            if is_dir:
+                if not entry.is_symlink():
+                    subdirs.append(entry.path)
+                continue
+
+            files.append(entry)
+
+    return files, subdirs
+
+
+def _extension_of(name: str) -> str:
+    """
+    Return the lowercase extension of a file name, including the leading dot.
+
+    Unlike Path.suffix, multi-part archive suffixes are kept whole
+    ("backup.tar.gz" -> ".tar.gz") and dotfiles keep their name as the
+    extension (".DS_Store" -> ".ds_store") so they can match extension rules.
+    Names without a dot, or ending in one, have no extension.
+    """
+    name_lower = name.lower()
+
+    if name_lower.endswith(_MULTIPART_SUFFIXES):
+        last_dot = name_lower.rfind(".")
+        return name_lower[name_lower.rfind(".", 0, last_dot):]
+
+    dot = name_lower.rfind(".")
+    if dot < 0 or dot == len(name_lower) - 1:
+        return ""
+    return name_lower[dot:]
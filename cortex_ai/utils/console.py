@@ -8,32 +8,143 @@ for styling and tables. Typer command handlers should call these helpers
 instead of printing directly.
 """
 
+import os
+import sys
+from operator import attrgetter
 from pathlib import Path
-from typing import Iterable, Sequence
-
-from rich.console import Console
-from rich.table import Table
+from typing import TYPE_CHECKING, Dict, Final, Iterable, List, Sequence
 
 from ..core.models import PlanSummary, PlanCategorySummary
 
-# Single shared console instance
-console = Console()
+if TYPE_CHECKING:  # Rich is imported lazily, on first styled output.
+    from rich.console import Console
+    from rich.table import Table
+
+# Shared console instance, created on first use by _get_console().
+_console: Console | None = None
+
+# Whether stdout is an interactive terminal, checked once at import.
+_IS_TTY = sys.stdout.isatty()
+
+# Formatted confidence strings keyed by value rounded to 2 decimals.
+_CONFIDENCE_CACHE_SIZE = 256
+_confidence_text: Dict[float, str] = {}
+
+# Lines collected by _write() and emitted together by _flush().
+_line_buffer: List[str] = []
+
+# Fields of a PlanCategorySummary read for each plan table row.
+_category_fields = attrgetter(
+    "category", "file_count", "total_size_mb", "avg_confidence", "sample_files"
+)
+
+# Fixed message text shared by the phase/status helpers below.
+_MSG_CLASSIFYING: Final = "Classifying files (rule-based and LLM)..."
+_MSG_BUILDING_PLAN: Final = "Building organization plan..."
+_MSG_SCANNING: Final = "Scanning files..."
+_MSG_APPLY_PROMPT: Final = "Apply this plan? (y/n): "
+_MSG_APPLYING_PLAN: Final = "Applying organization plan..."
+_MSG_NO_FILES_MOVED: Final = "No files were moved."
+_MSG_NO_CHANGES_APPLIED: Final = f"No changes applied.\n{_MSG_NO_FILES_MOVED}"
+_MSG_CLASSIFICATION_ABORTED: Final = f"Classification aborted. {_MSG_NO_FILES_MOVED}"
 
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
 
+def _get_console() -> Console:
+    """
+    Return the shared console, constructing it on first use.
+
+    Building a Console probes the terminal (size, colour system, env vars),
+    so it is deferred until something is actually printed.
+    """
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        # No auto-highlighting or emoji codes: styling comes only from the
+        # explicit markup in the helpers below.
+        _console = Console(
+            highlight=False, markup=True, emoji=False, log_time=False
+        )
+    return _console
+
+
+def _print(*objects, **kwargs) -> None:
+    """Print through the shared console."""
+    _get_console().print(*objects, **kwargs)
+
+
 def _path_str(path: Path | str) -> str:
     """Normalize a Path/str into a string for printing."""
-    if isinstance(path, Path):
-        return str(path)
-    return str(path)
+    return path if type(path) is str else str(path)
+
+def _emit_plain(message: str, end: str = "\n") -> None:
+    """
+    Print a message that contains no Rich markup.
+
+    On a terminal this goes through Rich as usual. When stdout is redirected
+    (file or pipe) the message is written to sys.stdout directly, skipping
+    Rich's markup parsing, highlighting and wrapping.
+    """
+    if _IS_TTY:
+        _print(message, end=end)
+    else:
+        write = sys.stdout.write
+        write(message)
+        write(end)
+
+def _write(line: str) -> None:
+    """Buffer one line of output; nothing is printed until _flush()."""
+    _line_buffer.append(line)
+
+def _flush() -> None:
+    """Print all buffered lines with a single console.print call."""
+    if not _line_buffer:
+        return
+    text = "\n".join(_line_buffer)
+    _line_buffer.clear()
+    _print(text)
 
 def _format_confidence(value: float | None) -> str:
-    """Format an average confidence for display in tables."""
+    """
+    Format an average confidence for display in tables.
+
+    Confidences cluster at a few two-decimal values, so formatted strings are
+    cached by rounded value (up to _CONFIDENCE_CACHE_SIZE entries).
+    """
     if value is None:
         return "-"
-    return f"{value:.2f}"
+    key = round(value, 2) + 0.0  # + 0.0 folds -0.0 into 0.0
+    text = _confidence_text.get(key)
+    if text is None:
+        text = f"{key:.2f}"
+        if len(_confidence_text) < _CONFIDENCE_CACHE_SIZE:
+            _confidence_text[key] = text
+    return text
+
+def _new_plan_table() -> Table:
+    """
+    Build an empty plan summary table (Category, Files, Size (MB),
+    Avg confidence).
+
+    Borderless and without edge padding or row separators, which keeps
+    rendering cheap.
+    """
+    from rich.table import Table
+
+    return Table(
+        "Category",
+        "Files",
+        "Size (MB)",
+        "Avg confidence",
+        show_header=True,
+        header_style="bold",
+        show_lines=False,
+        pad_edge=False,
+        box=None,
+    )
 
 def _print_plan_summary_common(plan: PlanSummary) -> None:
     """
@@ -43,45 +154,42 @@ def _print_plan_summary_common(plan: PlanSummary) -> None:
     root_str = _path_str(plan.root_path)
 
     # Header and overview
-    console.print(
+    _print(
         f"[bold]Proposed organization plan for: {root_str}[/bold]"
     )
-    console.print(
+    _emit_plain(
         f"Total files: {plan.total_files} | "
         f"Total size: {plan.total_size_mb:.2f} MB | "
         f"'uncertain_review' files: {plan.num_uncertain}"
     )
 
-    # Text header + line, then Rich table
-    console.print("Category Files Size (MB) Avg confidence")
-    console.print("-------------------------------------------------------")
-
-    table = Table("Category", "Files", "Size (MB)", "Avg confidence")
+    table = _new_plan_table()
 
+    # One pass over the categories: add each table row (through a pre-bound
+    # add_row) and buffer its sample filenames, which are printed together
+    # after the table.
+    add_row = table.add_row
     for cat in plan.categories:
-        table.add_row(
-            cat.category,
-            str(cat.file_count),
-            f"{cat.total_size_mb:.2f}",
-            _format_confidence(cat.avg_confidence),
+        name, file_count, size_mb, confidence, sample_files = _category_fields(cat)
+        add_row(
+            name,
+            str(file_count),
+            f"{size_mb:.2f}",
+            _format_confidence(confidence),
         )
+        if sample_files:
+            _write("")
+            _write(f"[bold]{name}[/bold]")
+            _write("Sample files:")
+            for sample in sample_files:
+                _write(f" - {sample}")
 
-    console.print(table)
-
-    # Sample filenames for each category
-    for cat in plan.categories:
-        if not cat.sample_files:
-            continue
-        console.print()
-        console.print(f"[bold]{cat.category}[/bold]")
-        console.print("Sample files:")
-        for name in cat.sample_files:
-            console.print(f" - {name}")
+    _print(table)
+    _flush()
 
     # Special note for uncertain_review, if present
-    has_uncertain = any(c.category == "uncertain_review" and c.file_count > 0 for c in plan.categories)
-    if has_uncertain:
-        console.print(
+    if plan.num_uncertain > 0:
+        _emit_plain(
             "Note: Files in the 'uncertain_review' category have low classification confidence."
         )
 
@@ -91,19 +199,25 @@ def _print_plan_summary_common(plan: PlanSummary) -> None:
 
 def print_error(message: str) -> None:
     """Print a generic error message in bold red."""
-    console.print(f"[bold red]{message}[/bold red]")
+    _print(f"[bold red]{message}[/bold red]")
+
+def _print_error_with_footer(
+    message: str, footer: str = _MSG_NO_FILES_MOVED
+) -> None:
+    """Print an error in bold red followed by an unstyled footer line."""
+    _print(f"[bold red]{message}[/bold red]\n{footer}")
 
 def print_warning(message: str) -> None:
     """Print a generic warning message in yellow."""
-    console.print(f"[bold yellow]Warning:[/bold yellow] {message}")
+    _print(f"[bold yellow]Warning:[/bold yellow] {message}")
 
 def print_success(message: str) -> None:
     """Print a generic success/completion message in green."""
-    console.print(f"[green]{message}[/green]")
+    _print(f"[green]{message}[/green]")
 
 def print_info(message: str) -> None:
     """Print a generic informational message (unstyled)."""
-    console.print(message)
+    _emit_plain(message)
 
 # ---------------------------------------------------------------------------
 # Command: organizer scan PATH
@@ -111,16 +225,16 @@ def print_info(message: str) -> None:
 
 def print_scan_start(path: Path | str) -> None:
     """Printed when a `scan` run begins."""
-    console.print(f"[bold]Scanning files under '{_path_str(path)}'...[/bold]")
+    _print(f"[bold]Scanning files under '{_path_str(path)}'...[/bold]")
 
 
 def print_scan_classifying() -> None:
-    """Printed during `scan` classification phase."""
-    console.print("Classifying files (rule-based and LLM)...")
+    """Printed during the classification phase of `scan` and `organize`."""
+    _emit_plain(_MSG_CLASSIFYING)
 
 def print_scan_building_plan() -> None:
     """Printed when `scan` is building the organization plan."""
-    console.print("Building organization plan...")
+    _emit_plain(_MSG_BUILDING_PLAN)
 
 
 def print_scan_plan_summary(plan: PlanSummary) -> None:
@@ -128,8 +242,8 @@ def print_scan_plan_summary(plan: PlanSummary) -> None:
     Print the full plan summary for `scan`, including the read-only footer.
     """
     _print_plan_summary_common(plan)
-    console.print(
-        "[green]Scan complete. This was a read-only run. No files were moved.[/green]"
+    _print(
+        f"[green]Scan complete. This was a read-only run. {_MSG_NO_FILES_MOVED}[/green]"
     )
 
 # Scan-specific / shared errors
@@ -137,13 +251,12 @@ def print_scan_plan_summary(plan: PlanSummary) -> None:
 
 def print_scan_error_path_not_found(path: Path | str) -> None:
     """`scan`: path not found."""
-    msg = f"Error: Path not found: {_path_str(path)}"
-    print_error(msg)
+    _print(f"[bold red]Error: Path not found: {_path_str(path)}[/bold red]")
 
 
 def print_scan_empty_directory(path: Path | str) -> None:
     """`scan`: empty directory (no files)."""
-    console.print(f"No files found under '{_path_str(path)}'.")
+    _emit_plain(f"No files found under '{_path_str(path)}'.")
 
 
 def print_scan_error_missing_api_key() -> None:
@@ -160,11 +273,9 @@ def print_scan_error_llm_auth_failure() -> None:
 
 def print_scan_error_llm_unavailable() -> None:
     """`scan`: LLM service unavailable / timeout / network error."""
-    print_error(
-        "Error: LLM classification service is currently unavailable. Please try again later."
-    )
-    console.print(
-        "Classification aborted due to LLM error. No files were moved."
+    _print_error_with_footer(
+        "Error: LLM classification service is currently unavailable. Please try again later.",
+        f"Classification aborted due to LLM error. {_MSG_NO_FILES_MOVED}",
     )
 
 
@@ -175,22 +286,21 @@ def print_scan_error_llm_unavailable() -> None:
 
 def print_organize_start(path: Path | str) -> None:
     """Printed at the beginning of `organize`."""
-    console.print(f"[bold]Analyzing folder '{_path_str(path)}'...[/bold]")
+    _print(f"[bold]Analyzing folder '{_path_str(path)}'...[/bold]")
 
 
 def print_organize_scanning() -> None:
     """`organize`: scanning phase message."""
-    console.print("Scanning files...")
+    _emit_plain(_MSG_SCANNING)
 
 
-def print_organize_classifying() -> None:
-    """`organize`: classification phase message."""
-    console.print("Classifying files (rule-based and LLM)...")
+# `organize`: classification phase message (same text as `scan`).
+print_organize_classifying = print_scan_classifying
 
 
 def print_organize_building_plan() -> None:
     """`organize`: plan-building message."""
-    console.print("Building organization plan...")
+    _emit_plain(_MSG_BUILDING_PLAN)
 
 
 def print_organize_plan_summary(plan: PlanSummary) -> None:
@@ -209,18 +319,17 @@ def print_apply_prompt() -> None:
     This function only prints; command code is responsible for reading input.
     """
     # We keep the exact text, adding a subtle styling marker.
-    console.print("Apply this plan? (y/n): ", end="")
+    _emit_plain(_MSG_APPLY_PROMPT, end="")
 
 
 def print_no_changes_applied() -> None:
     """Printed when user declines to apply the plan."""
-    console.print("No changes applied.")
-    console.print("No files were moved.")
+    _emit_plain(_MSG_NO_CHANGES_APPLIED)
 
 
 def print_applying_plan() -> None:
     """Printed just before moves during `organize`."""
-    console.print("Applying organization plan...")
+    _emit_plain(_MSG_APPLYING_PLAN)
 
 
 def print_move_warning(file_path: Path | str, error_reason: str) -> None:
@@ -229,21 +338,22 @@ def print_move_warning(file_path: Path | str, error_reason: str) -> None:
 
     Text: "Warning: failed to move '{file_path}': {error_reason}"
     """
-    message = f"failed to move '{_path_str(file_path)}': {error_reason}"
-    print_warning(message)
+    _print(
+        f"[bold yellow]Warning:[/bold yellow] failed to move "
+        f"'{_path_str(file_path)}': {error_reason}"
+    )
 
 
 def print_uncertain_review_behavior(sample_files: Sequence[str]) -> None:
     """
     Printed after moves for uncertain_review behavior, with example filenames.
     """
-    console.print(
+    body = (
         "Files in the 'uncertain_review' category were moved to 'uncertain_review' directory due to low classification confidence."
     )
     if sample_files:
-        console.print("Uncertain files")
-        for name in sample_files:
-            console.print(f" - {name}")
+        body += "\nUncertain files\n" + "\n".join(f" - {name}" for name in sample_files)
+    _emit_plain(body)
 
 
 def print_organize_move_overview(
@@ -255,10 +365,8 @@ def print_organize_move_overview(
     - "Moved {moved_count} files into {category_count} categories."
     - "{uncertain_count} files left as 'uncertain_review'."
     """
-    console.print(
-        f"Moved {moved_count} files into {category_count} categories."
-    )
-    console.print(
+    _emit_plain(
+        f"Moved {moved_count} files into {category_count} categories.\n"
         f"{uncertain_count} files left as 'uncertain_review'."
     )
 
@@ -272,10 +380,8 @@ def print_organize_move_summary(
     - "Moved {moved_success} files successfully."
     - "Failed to move {failed_count} files (see warnings above)."
     """
-    console.print(
-        f"Moved {moved_success} files successfully."
-    )
-    console.print(
+    _emit_plain(
+        f"Moved {moved_success} files successfully.\n"
         f"Failed to move {failed_count} files (see warnings above)."
     )
 
@@ -289,9 +395,9 @@ def print_move_log_written(log_path: Path | str, had_moves: bool) -> None:
     """
     path_str = _path_str(log_path)
     if had_moves:
-        console.print(f"Move log written to '{path_str}'.")
+        _emit_plain(f"Move log written to '{path_str}'.")
     else:
-        console.print(
+        _emit_plain(
             f"Move log written to '{path_str}' (no moves recorded)."
         )
 
@@ -301,37 +407,35 @@ def print_move_log_written(log_path: Path | str, had_moves: bool) -> None:
 
 def print_organize_error_path_not_found(path: Path | str) -> None:
     """`organize`: path not found (no moves)."""
-    msg = f"Error: Path not found: {_path_str(path)}"
-    print_error(msg)
-    console.print("No files were moved.")
+    _print(
+        f"[bold red]Error: Path not found: {_path_str(path)}[/bold red]\n"
+        f"{_MSG_NO_FILES_MOVED}"
+    )
 
 
 def print_organize_empty_directory(path: Path | str) -> None:
     """`organize`: empty directory (no moves)."""
-    console.print(f"No files found under '{_path_str(path)}'.")
-    console.print("No files were moved.")
+    _emit_plain(f"No files found under '{_path_str(path)}'.\n{_MSG_NO_FILES_MOVED}")
 
 
 def print_organize_error_missing_api_key() -> None:
     """`organize`: missing API key (no moves)."""
     msg = "Error: OPENAI_API_KEY not set. Please set it in your environment or .env file."
-    print_error(msg)
-    console.print("No files were moved.")
+    _print_error_with_footer(msg)
 
 
 def print_organize_error_llm_auth_failure() -> None:
     """`organize`: invalid API key / auth failure (classification aborted, no moves)."""
     msg = "Error: LLM API authentication failed. Please check your API key."
-    print_error(msg)
-    console.print("Classification aborted. No files were moved.")
+    _print_error_with_footer(msg, _MSG_CLASSIFICATION_ABORTED)
 
 
 def print_organize_error_llm_unavailable() -> None:
     """`organize`: LLM service unavailable (classification aborted, no moves)."""
-    print_error(
-        "Error: LLM classification service is currently unavailable. Please try again later."
+    _print_error_with_footer(
+        "Error: LLM classification service is currently unavailable. Please try again later.",
+        _MSG_CLASSIFICATION_ABORTED,
     )
-    console.print("Classification aborted. No files were moved.")
 
 
 def print_no_files_were_moved() -> None:
@@ -340,7 +444,7 @@ def print_no_files_were_moved() -> None:
 
     - "No files were moved."
     """
-    console.print("No files were moved.")
+    _emit_plain(_MSG_NO_FILES_MOVED)
 
 
 # ---------------------------------------------------------------------------
@@ -356,9 +460,20 @@ def print_version(version: str, python_version: str, api_key_set: bool) -> None:
     - "Python {python_version}"
     - "LLM_API_KEY: set" / "LLM_API_KEY: not set"
     """
-    console.print(f"[bold]organizer {version}[/bold]")
-    console.print(f"Python {python_version}")
-    if api_key_set:
-        console.print("LLM_API_KEY: set")
-    else:
-        console.print("LLM_API_KEY: not set")
\ No newline at end of file
+    api_key_status = "set" if api_key_set else "not set"
+    # Written directly so `version` never has to import or construct the
+    # Rich console. The title is bolded with a raw ANSI sequence only on a
+    # terminal that accepts styling (not NO_COLOR, not TERM=dumb), as Rich
+    # would decide.
+    title = f"organizer {version}"
+    if (
+        _IS_TTY
+        and not os.environ.get("NO_COLOR")
+        and os.environ.get("TERM") != "dumb"
+    ):
+        title = f"\x1b[1m{title}\x1b[0m"
+    sys.stdout.write(
+        f"{title}\n"
+        f"Python {python_version}\n"
+        f"LLM_API_KEY: {api_key_status}\n"
+    )
\ No newline at end of file